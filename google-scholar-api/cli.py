@@ -7,22 +7,60 @@ Usage:
     uv run python cli.py search "RAG arxiv" --year-from 2023
     uv run python cli.py author "Geoffrey Hinton"
     uv run python cli.py profile JicYPdAAAAAJ
+    uv run python cli.py lookup "Geoffrey Hinton"
+    cat queries.txt | uv run python cli.py search --persist
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 import os
 import sys
 
-from scholar import (
-    get_author_profile,
-    get_paper_citations,
-    search_author,
-    search_scholar,
-    set_api_key,
-)
+# The scholar package is imported inside each command so that --help and
+# argument errors return without loading the search stack.
+
+
+def _write(lines):
+    """Write all output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _write_json(result):
+    """Write a result object as indented JSON."""
+    from scholar._json import dumps
+
+    sys.stdout.write(dumps(result.to_dict()) + "\n")
+
+
+def _format_paper(i, paper, details=True):
+    """Format one paper as a multi-line block."""
+    lines = [
+        f"\n{i}. {paper.title}",
+        f"   Authors: {paper.authors}",
+        f"   Venue: {paper.venue} ({paper.year})",
+    ]
+    if details:
+        lines.append(f"   Citations: {paper.citations}")
+        if paper.url:
+            lines.append(f"   URL: {paper.url}")
+        if paper.pdf_url:
+            lines.append(f"   PDF: {paper.pdf_url}")
+    return "\n".join(lines)
+
+
+def _format_author(author):
+    """Format one author search match as a multi-line block."""
+    lines = [
+        f"\nName: {author.name}",
+        f"  ID: {author.author_id}",
+        f"  Affiliation: {author.affiliation}",
+        f"  Citations: {author.citations}",
+    ]
+    if author.interests:
+        lines.append(f"  Interests: {', '.join(author.interests[:5])}")
+    return "\n".join(lines)
 
 
 def setup_api_key():
@@ -33,42 +71,86 @@ def setup_api_key():
         print("Set it with: export SERPAPI_KEY='your-key-here'")
         print("Get a free key at: https://serpapi.com")
         sys.exit(1)
+
+    from scholar import set_api_key
+
     set_api_key(key)
 
 
 def cmd_search(args):
-    """Search for papers."""
-    results = search_scholar(
-        query=args.query,
-        year_from=args.year_from,
-        year_to=args.year_to,
-        num_results=args.num,
+    """Search for papers, or one query per stdin line with --persist."""
+    if not args.persist:
+        _search(args.query, args)
+        return
+
+    for line in sys.stdin:
+        query = line.strip()
+        if query:
+            _search(query, args)
+            sys.stdout.flush()
+
+
+async def _search_pages(query, args):
+    """Fetch all result pages (10 papers each) concurrently and merge them."""
+    from scholar import ScholarResult, async_search_scholar, close_async_client
+
+    # Like the single-request path, ask for at least one result
+    num = max(1, args.num)
+    pages = await asyncio.gather(
+        *(
+            async_search_scholar(
+                query=query,
+                year_from=args.year_from,
+                year_to=args.year_to,
+                num_results=min(10, num - start),
+                start=start,
+            )
+            for start in range(0, num, 10)
+        )
+    )
+    await close_async_client()
+
+    papers = [paper for page in pages for paper in page.papers]
+    errors = [page.error for page in pages if page.error]
+    return ScholarResult(
+        query=query,
+        total_results=len(papers),
+        papers=papers,
+        error=errors[0] if errors and not papers else None,
     )
 
+
+def _search(query, args):
+    """Run one search and print the results."""
+    if args.concurrent:
+        results = asyncio.run(_search_pages(query, args))
+    else:
+        from scholar import search_scholar
+
+        results = search_scholar(
+            query=query,
+            year_from=args.year_from,
+            year_to=args.year_to,
+            num_results=args.num,
+        )
+
     if results.error:
         print(f"Error: {results.error}")
         return
 
     if args.json:
-        print(json.dumps(results.to_dict(), indent=2))
+        _write_json(results)
         return
 
-    print(f"\nFound {results.total_results} papers for: {results.query}\n")
-    print("=" * 70)
-
-    for i, paper in enumerate(results.papers, 1):
-        print(f"\n{i}. {paper.title}")
-        print(f"   Authors: {paper.authors}")
-        print(f"   Venue: {paper.venue} ({paper.year})")
-        print(f"   Citations: {paper.citations}")
-        if paper.url:
-            print(f"   URL: {paper.url}")
-        if paper.pdf_url:
-            print(f"   PDF: {paper.pdf_url}")
+    lines = [f"\nFound {results.total_results} papers for: {results.query}\n", "=" * 70]
+    lines.extend(_format_paper(i, paper) for i, paper in enumerate(results.papers, 1))
+    _write(lines)
 
 
 def cmd_author(args):
     """Search for an author."""
+    from scholar import search_author
+
     results = search_author(args.name)
 
     if results.error:
@@ -76,23 +158,18 @@ def cmd_author(args):
         return
 
     if args.json:
-        print(json.dumps(results.to_dict(), indent=2))
+        _write_json(results)
         return
 
-    print(f"\nAuthors matching: {args.name}\n")
-    print("=" * 70)
-
-    for author in results.authors:
-        print(f"\nName: {author.name}")
-        print(f"  ID: {author.author_id}")
-        print(f"  Affiliation: {author.affiliation}")
-        print(f"  Citations: {author.citations}")
-        if author.interests:
-            print(f"  Interests: {', '.join(author.interests[:5])}")
+    lines = [f"\nAuthors matching: {args.name}\n", "=" * 70]
+    lines.extend(_format_author(author) for author in results.authors)
+    _write(lines)
 
 
 def cmd_profile(args):
     """Get author profile by ID."""
+    from scholar import get_author_profile
+
     results = get_author_profile(args.author_id)
 
     if results.error:
@@ -100,32 +177,108 @@ def cmd_profile(args):
         return
 
     if args.json:
-        print(json.dumps(results.to_dict(), indent=2))
+        _write_json(results)
         return
 
     if not results.authors:
         print("Author not found.")
         return
 
+    _write(_profile_lines(results))
+
+
+def _profile_lines(results):
+    """Format an author profile lookup as output lines."""
     author = results.authors[0]
-    print(f"\n{author.name}")
-    print("=" * 70)
-    print(f"Affiliation: {author.affiliation}")
-    print(f"Total Citations: {author.citations}")
-    print(f"h-index: {results.h_index}")
-    print(f"i10-index: {results.i10_index}")
+    lines = [
+        f"\n{author.name}",
+        "=" * 70,
+        f"Affiliation: {author.affiliation}",
+        f"Total Citations: {author.citations}",
+        f"h-index: {results.h_index}",
+        f"i10-index: {results.i10_index}",
+    ]
 
     if author.interests:
-        print(f"Interests: {', '.join(author.interests[:5])}")
+        lines.append(f"Interests: {', '.join(author.interests[:5])}")
 
     if results.publications:
-        print("\nTop Publications:")
-        for pub in results.publications[:5]:
-            print(f"  - {pub['title']} ({pub['year']}) - {pub['citations']} citations")
+        lines.append("\nTop Publications:")
+        lines.extend(
+            f"  - {pub['title']} ({pub['year']}) - {pub['citations']} citations"
+            for pub in results.publications[:5]
+        )
+
+    return lines
+
+
+def cmd_lookup(args):
+    """Look up an author's profile and papers mentioning them in one go."""
+    author_results, paper_results, profile = asyncio.run(_lookup(args.name))
+
+    if author_results.error:
+        print(f"Error: {author_results.error}")
+        return
+
+    if args.json:
+        from scholar._json import dumps
+
+        output = {
+            "author": author_results.to_dict(),
+            "profile": profile.to_dict() if profile else None,
+            "papers": paper_results.to_dict(),
+        }
+        sys.stdout.write(dumps(output) + "\n")
+        return
+
+    if profile is not None and profile.error:
+        print(f"Error: {profile.error}")
+        return
+
+    if profile is None or not profile.authors:
+        print(f"No author found for: {args.name}")
+        return
+
+    lines = _profile_lines(profile)
+    if paper_results.papers:
+        lines.append(f"\nPapers matching: {args.name}")
+        lines.extend(
+            _format_paper(i, paper, details=False)
+            for i, paper in enumerate(paper_results.papers, 1)
+        )
+    _write(lines)
+
+
+async def _lookup(name):
+    """
+    Search for an author and, at the same time, for papers matching the name.
+
+    The paper search is speculative: it costs one extra request but hides a
+    round-trip users would otherwise make next. The profile lookup depends on
+    the author search, so it runs afterwards.
+    """
+    from scholar import (
+        async_get_author_profile,
+        async_search_author,
+        async_search_scholar,
+        close_async_client,
+    )
+
+    author_results, paper_results = await asyncio.gather(
+        async_search_author(name),
+        async_search_scholar(name, num_results=3),
+    )
+    profile = None
+    if author_results.authors:
+        profile = await async_get_author_profile(author_results.authors[0].author_id)
+    await close_async_client()
+    return author_results, paper_results, profile
 
 
 def cmd_citations(args):
     """Get papers citing a given paper."""
+    from scholar import get_paper_citations
+
     results = get_paper_citations(args.citation_id, num_results=args.num)
 
     if results.error:
@@ -133,16 +286,14 @@ def cmd_citations(args):
         return
 
     if args.json:
-        print(json.dumps(results.to_dict(), indent=2))
+        _write_json(results)
         return
 
-    print(f"\nPapers citing: {args.citation_id}\n")
-    print("=" * 70)
-
-    for i, paper in enumerate(results.citing_papers, 1):
-        print(f"\n{i}. {paper.title}")
-        print(f"   Authors: {paper.authors}")
-        print(f"   Venue: {paper.venue} ({paper.year})")
+    lines = [f"\nPapers citing: {args.citation_id}\n", "=" * 70]
+    lines.extend(
+        _format_paper(i, paper, details=False) for i, paper in enumerate(results.citing_papers, 1)
+    )
+    _write(lines)
 
 
 def main():
@@ -155,7 +306,10 @@ Examples:
   %(prog)s search "RAG arxiv" --num 5 --year-from 2023
   %(prog)s author "Geoffrey Hinton"
   %(prog)s profile JicYPdAAAAAJ
+  %(prog)s lookup "Geoffrey Hinton"
+  %(prog)s search "transformers" --num 40 --concurrent
   %(prog)s search "transformers" --json
+  %(prog)s search --persist < queries.txt
         """,
     )
 
@@ -163,13 +317,23 @@ Examples:
 
     # Search command
     search_parser = subparsers.add_parser("search", help="Search for papers")
-    search_parser.add_argument("query", help="Search query")
+    search_parser.add_argument("query", nargs="?", help="Search query")
     search_parser.add_argument(
         "--num", "-n", type=int, default=10, help="Number of results (default: 10)"
     )
     search_parser.add_argument("--year-from", type=int, help="Filter from year")
     search_parser.add_argument("--year-to", type=int, help="Filter to year")
     search_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    search_parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Fetch results in pages of 10 in parallel (allows --num above 20)",
+    )
+    search_parser.add_argument(
+        "--persist",
+        action="store_true",
+        help="Read one query per line from stdin and search each in this process",
+    )
     search_parser.set_defaults(func=cmd_search)
 
     # Author search command
@@ -184,6 +348,14 @@ Examples:
     profile_parser.add_argument("--json", action="store_true", help="Output as JSON")
     profile_parser.set_defaults(func=cmd_profile)
 
+    # Lookup command
+    lookup_parser = subparsers.add_parser(
+        "lookup", help="Get an author's profile and matching papers at once"
+    )
+    lookup_parser.add_argument("name", help="Author name")
+    lookup_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    lookup_parser.set_defaults(func=cmd_lookup)
+
     # Citations command
     citations_parser = subparsers.add_parser("citations", help="Get citing papers")
     citations_parser.add_argument("citation_id", help="Citation ID from search results")
@@ -197,6 +369,9 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
+    if args.command == "search" and not (args.query or args.persist):
+        search_parser.error("the following arguments are required: query (or --persist)")
+
     setup_api_key()
     args.func(args)
 
@@ -9,7 +9,13 @@ from __future__ import annotations
 import os
 
 from anthropic import Anthropic
-from scholar import get_anthropic_tools, process_anthropic_tool_use, set_api_key
+from scholar import (
+    build_numbered_prompt,
+    get_anthropic_tools,
+    process_anthropic_tool_use,
+    set_api_key,
+    split_numbered_response,
+)
 
 # set API keys
 set_api_key(os.environ.get("SERPAPI_KEY", "your-serpapi-key"))
@@ -73,22 +79,33 @@ Provide comprehensive literature reviews when asked."""
     return "\n".join(text_blocks)
 
 
-# Example usage
-if __name__ == "__main__":
-    # Example 1: Literature search
-    print("=== Literature Search ===")
-    response = chat_with_scholar(
-        "Find recent papers on retrieval augmented generation from 2023-2024. "
-        "Include both arXiv preprints and peer-reviewed papers."
-    )
-    print(response)
+def chat_with_scholar_batch(questions: list[str]) -> list[str]:
+    """
+    Answer several independent questions in one conversation.
 
-    print("\n" + "=" * 50 + "\n")
+    The questions share a single request (and a single system prompt), so
+    per-request overhead is paid once. Returns one answer per question.
+    """
+    response = chat_with_scholar(build_numbered_prompt(questions))
+    return split_numbered_response(response, len(questions))
 
-    # Example 2: Author lookup
-    print("=== Author Lookup ===")
-    response = chat_with_scholar(
-        "Find information about Yann LeCun on Google Scholar, "
-        "including his h-index and most cited papers."
-    )
-    print(response)
+
+# Example usage
+if __name__ == "__main__":
+    questions = {
+        "Literature Search": (
+            "Find recent papers on retrieval augmented generation from 2023-2024. "
+            "Include both arXiv preprints and peer-reviewed papers."
+        ),
+        "Author Lookup": (
+            "Find information about Yann LeCun on Google Scholar, "
+            "including his h-index and most cited papers."
+        ),
+    }
+
+    answers = chat_with_scholar_batch(list(questions.values()))
+
+    for label, answer in zip(questions, answers, strict=True):
+        print(f"=== {label} ===")
+        print(answer)
+        print("\n" + "=" * 50 + "\n")
@@ -1,69 +1,79 @@
 """
 Basic usage example - Direct function calls without LLM integration.
+
+The independent searches run concurrently with asyncio.gather; only the
+profile lookup waits, because it needs an author ID from the author search.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 
-from scholar import get_author_profile, search_author, search_scholar, set_api_key
+from scholar import (
+    async_get_author_profile,
+    async_search_author,
+    async_search_scholar,
+    close_async_client,
+    set_api_key,
+)
 
 # set your SerpAPI key (or use SERPAPI_KEY environment variable)
 set_api_key(os.environ.get("SERPAPI_KEY", "your-api-key-here"))
 
-# Example 1: Search for papers
-print("=== Searching for papers on RAG ===")
-results = search_scholar(
-    query="retrieval augmented generation",
-    year_from=2023,
-    num_results=5,
-)
 
-if results.error:
-    print(f"Error: {results.error}")
-else:
-    for paper in results.papers:
-        print(f"\nTitle: {paper.title}")
-        print(f"Authors: {paper.authors}")
-        print(f"Venue: {paper.venue} ({paper.year})")
-        print(f"Citations: {paper.citations}")
-        print(f"URL: {paper.url}")
+async def main():
+    # Examples 1-3 have no dependencies on each other, so fire them together
+    results, preprints, author_results = await asyncio.gather(
+        async_search_scholar("retrieval augmented generation", year_from=2023, num_results=5),
+        async_search_scholar("large language models arxiv", year_from=2024, num_results=3),
+        async_search_author("Geoffrey Hinton"),
+    )
 
-# Example 2: Search for arXiv preprints
-print("\n\n=== Searching for arXiv preprints ===")
-results = search_scholar(
-    query="large language models arxiv",
-    year_from=2024,
-    num_results=3,
-)
+    # Example 1: Search for papers
+    print("=== Searching for papers on RAG ===")
+    if results.error:
+        print(f"Error: {results.error}")
+    else:
+        for paper in results.papers:
+            print(f"\nTitle: {paper.title}")
+            print(f"Authors: {paper.authors}")
+            print(f"Venue: {paper.venue} ({paper.year})")
+            print(f"Citations: {paper.citations}")
+            print(f"URL: {paper.url}")
+
+    # Example 2: Search for arXiv preprints
+    print("\n\n=== Searching for arXiv preprints ===")
+    for paper in preprints.papers:
+        print(f"\n{paper.title}")
+        print(f"  {paper.venue} | {paper.citations} citations")
+
+    # Example 3: Find an author
+    print("\n\n=== Finding author ===")
+    for author in author_results.authors:
+        print(f"\nName: {author.name}")
+        print(f"ID: {author.author_id}")
+        print(f"Affiliation: {author.affiliation}")
+        print(f"Citations: {author.citations}")
+        print(f"Interests: {', '.join(author.interests)}")
 
-for paper in results.papers:
-    print(f"\n{paper.title}")
-    print(f"  {paper.venue} | {paper.citations} citations")
+    # Example 4: Get author profile with h-index
+    if author_results.authors:
+        author_id = author_results.authors[0].author_id
+        print(f"\n\n=== Getting profile for {author_id} ===")
+        profile = await async_get_author_profile(author_id)
 
-# Example 3: Find an author
-print("\n\n=== Finding author ===")
-author_results = search_author("Geoffrey Hinton")
+        if profile.authors:
+            author = profile.authors[0]
+            print(f"Name: {author.name}")
+            print(f"H-index: {profile.h_index}")
+            print(f"i10-index: {profile.i10_index}")
+            print(f"Total citations: {author.citations}")
+            print("\nTop publications:")
+            for pub in profile.publications[:5]:
+                print(f"  - {pub['title']} ({pub['year']}) - {pub['citations']} citations")
 
-for author in author_results.authors:
-    print(f"\nName: {author.name}")
-    print(f"ID: {author.author_id}")
-    print(f"Affiliation: {author.affiliation}")
-    print(f"Citations: {author.citations}")
-    print(f"Interests: {', '.join(author.interests)}")
+    await close_async_client()
 
-# Example 4: Get author profile with h-index
-if author_results.authors:
-    author_id = author_results.authors[0].author_id
-    print(f"\n\n=== Getting profile for {author_id} ===")
-    profile = get_author_profile(author_id)
 
-    if profile.authors:
-        author = profile.authors[0]
-        print(f"Name: {author.name}")
-        print(f"H-index: {profile.h_index}")
-        print(f"i10-index: {profile.i10_index}")
-        print(f"Total citations: {author.citations}")
-        print("\nTop publications:")
-        for pub in profile.publications[:5]:
-            print(f"  - {pub['title']} ({pub['year']}) - {pub['citations']} citations")
+asyncio.run(main())
@@ -6,10 +6,16 @@ Works with any LLM via their tool/function calling APIs.
 
 from __future__ import annotations
 
+from .formatting import build_numbered_prompt, format_results, split_numbered_response
 from .search import (
     AuthorResult,
     CitationResult,
     ScholarResult,
+    async_get_author_profile,
+    async_get_paper_citations,
+    async_search_author,
+    async_search_scholar,
+    close_async_client,
     get_author_profile,
     get_paper_citations,
     search_author,
@@ -33,6 +39,12 @@ __all__ = [
     "get_author_profile",
     "get_paper_citations",
     "set_api_key",
+    # Async search functions
+    "async_search_scholar",
+    "async_search_author",
+    "async_get_author_profile",
+    "async_get_paper_citations",
+    "close_async_client",
     # Result types
     "ScholarResult",
     "AuthorResult",
@@ -44,4 +56,8 @@ __all__ = [
     "execute_tool",
     "process_openai_tool_call",
     "process_anthropic_tool_use",
+    # Prompt helpers
+    "format_results",
+    "build_numbered_prompt",
+    "split_numbered_response",
 ]
@@ -0,0 +1,116 @@
+"""
+On-disk cache for SerpAPI responses.
+
+Responses are stored as JSON files under ~/.cache/scholar-api, keyed by a hash of
+the request parameters (the API key is excluded), so repeated searches skip the
+network round-trip and do not use up API credits. Error responses are never cached.
+Paper searches expire after a day, author searches and profiles after a week.
+Author searches and profiles are also kept in a small in-memory LRU for an hour,
+since the same authors tend to be looked up repeatedly while exploring a topic.
+
+Set SERP_CACHE_DIR to use another directory, or SCHOLAR_CACHE_DISABLE=1 to bypass
+the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from ._json import loads
+
+CACHE_DIR = Path.home() / ".cache" / "scholar-api"
+CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# New papers and citations show up daily; profiles change slowly
+CACHE_TTLS = {"google_scholar": 24 * 60 * 60}
+
+MEMORY_ENGINES = {"google_scholar_author", "google_scholar_profiles"}
+MEMORY_SIZE = 256
+MEMORY_TTL = 60 * 60  # seconds
+
+# key -> (stored at, response); shared with the speculative prefetch threads
+_memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _enabled() -> bool:
+    return os.environ.get("SCHOLAR_CACHE_DISABLE", "").lower() not in ("1", "true", "yes")
+
+
+def _cache_dir() -> Path:
+    # Read per call so a SERP_CACHE_DIR from .env (loaded after import) applies
+    return Path(os.environ.get("SERP_CACHE_DIR") or CACHE_DIR)
+
+
+def cache_key(params: dict) -> str:
+    """Stable key for a set of request parameters, ignoring the API key."""
+    payload = json.dumps({k: v for k, v in params.items() if k != "api_key"}, sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _remember(key: str, results: dict) -> None:
+    with _memory_lock:
+        _memory[key] = (time.time(), results)
+        _memory.move_to_end(key)
+        if len(_memory) > MEMORY_SIZE:
+            _memory.popitem(last=False)
+
+
+def get(params: dict) -> dict | None:
+    """Return the cached response for params, or None if missing or expired."""
+    if not _enabled():
+        return None
+    key = cache_key(params)
+    in_memory = params.get("engine") in MEMORY_ENGINES
+    if in_memory:
+        with _memory_lock:
+            entry = _memory.get(key)
+            if entry is not None and time.time() - entry[0] <= MEMORY_TTL:
+                _memory.move_to_end(key)
+                return entry[1]
+
+    path = _cache_dir() / f"{key}.json"
+    try:
+        ttl = CACHE_TTLS.get(params.get("engine"), CACHE_TTL)
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        results = loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if in_memory:
+        _remember(key, results)
+    return results
+
+
+def put(params: dict, results: dict) -> None:
+    """
+    Store a successful response. Failures to write are ignored.
+
+    The file is written under a temporary name and renamed into place, so a
+    concurrent reader never sees a partially written entry.
+    """
+    if not _enabled() or "error" in results:
+        return
+    key = cache_key(params)
+    if params.get("engine") in MEMORY_ENGINES:
+        _remember(key, results)
+    try:
+        cache_dir = _cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(results, f)
+            os.replace(tmp, cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
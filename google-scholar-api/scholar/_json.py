@@ -0,0 +1,25 @@
+"""
+JSON helpers shared by the CLI and chat session.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+    from orjson import loads
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+    loads = json.loads
+
+__all__ = ["dumps", "loads"]
+
+
+def dumps(obj) -> str:
+    """Serialize obj as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
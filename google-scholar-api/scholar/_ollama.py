@@ -0,0 +1,30 @@
+"""
+Shared Ollama client for the chat session and examples.
+
+One AsyncClient is kept per event loop so every turn reuses the same
+connection pool instead of opening new sockets. The host is taken from
+OLLAMA_HOST as usual.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from ollama import AsyncClient
+
+# Generation can take minutes on a cold model; everything else should be quick
+TIMEOUT = httpx.Timeout(connect=5.0, read=300.0, write=30.0, pool=5.0)
+
+_client: AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_async_client() -> AsyncClient:
+    """Return the shared Ollama AsyncClient for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = AsyncClient(timeout=TIMEOUT, transport=httpx.AsyncHTTPTransport(retries=2))
+        _client_loop = loop
+    return _client
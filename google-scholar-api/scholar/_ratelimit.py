@@ -0,0 +1,59 @@
+"""
+Client-side rate limiting for async SerpAPI requests.
+
+A token bucket keeps the request rate under SERP_QPM requests per minute
+(default 100) and a semaphore caps in-flight requests at SERP_CONC (default 5).
+Staying under the limits avoids 429s from SerpAPI and the much longer stalls
+that follow when Google Scholar starts blocking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+REQUESTS_PER_MINUTE = 100
+MAX_CONCURRENT = 5
+
+
+class Limiter:
+    """
+    Async context manager that waits for a free slot and a rate token.
+
+    Limits not passed in are read from the environment when the limiter is
+    created, so values loaded from .env after import still apply.
+    """
+
+    def __init__(self, per_minute: int | None = None, concurrency: int | None = None):
+        if per_minute is None:
+            per_minute = int(os.environ.get("SERP_QPM", REQUESTS_PER_MINUTE))
+        if concurrency is None:
+            concurrency = int(os.environ.get("SERP_CONC", MAX_CONCURRENT))
+        self._rate = per_minute / 60.0
+        # Allow short bursts of up to one request per concurrency slot
+        self._capacity = float(max(1, concurrency))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _take(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        try:
+            await self._take()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
@@ -0,0 +1,535 @@
+"""
+Chat sessions with a local Ollama model that can search Google Scholar.
+
+Shared by chat.py, phi4_chat.py and examples/ollama_example.py. Each user turn
+is first classified by a small router model, whose output is constrained to
+SEARCH_SCHEMA by Ollama's structured outputs, so it always parses. If a search is needed the
+session runs it and the main chat model summarizes the results; otherwise the
+chat model simply replies.
+
+Models can be overridden with SCHOLAR_CHAT_MODEL and SCHOLAR_ROUTER_MODEL.
+Set SCHOLAR_SPECULATIVE=1 to prefetch likely follow-up searches while the
+summary is generated (this spends extra SerpAPI credits).
+
+Requires the ``ollama`` extra. The REPL reads input with prompt_toolkit when it
+is installed (it is part of that extra) and falls back to input() otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import sys
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ollama import AsyncClient, ResponseError
+
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:  # pragma: no cover - optional, the REPL falls back to input()
+    PromptSession = None
+
+from ._json import loads
+from ._ollama import get_async_client
+from .formatting import build_numbered_prompt, format_results, split_numbered_response
+from .search import ScholarResult, search_scholar
+
+# Heavy model for user-facing prose, small quantized model for routing
+MODEL = os.environ.get("SCHOLAR_CHAT_MODEL", "phi4")
+ROUTER_MODEL = os.environ.get("SCHOLAR_ROUTER_MODEL", "qwen2.5:0.5b-instruct-q4_K_M")
+
+# Most recent messages the router sees, so follow-ups like "make that 10" resolve
+ROUTER_CONTEXT = 4
+
+# Keep the model (and its KV cache for the unchanged system-prompt prefix)
+# resident between turns instead of reloading and re-prefilling it.
+# num_ctx is a hard cap on prompt size; history compaction keeps turns below it.
+KEEP_ALIVE = "30m"
+OPTIONS = {"num_ctx": 4096}
+
+# Short acknowledgement streamed while the search request is in flight
+ACK_PROMPT = """In one short sentence, tell me you are searching Google Scholar for "{query}". Do not list or invent any papers."""
+ACK_MAX_TOKENS = 30
+
+# Speculative prefetches kept in flight at once (oldest dropped first)
+MAX_PREFETCH = 3
+
+# Turns (user + assistant pairs) kept verbatim; older ones are folded into a
+# summary written by the router model, so per-turn prefill stays constant
+MAX_TURNS = 6
+# Extra messages allowed past MAX_TURNS before compacting again, so the summary
+# call (and the change to the cached prefix) happens every few turns, not every turn
+COMPACT_SLACK = 4
+
+SUMMARY_PROMPT = """Summarize the following conversation between a user and a research assistant in at most 200 tokens.
+Keep the topics searched, notable paper titles, and any preferences the user expressed."""
+
+SYSTEM_PROMPT = """You are a helpful research assistant with access to Google Scholar search.
+
+**Search Format Guide:**
+- Basic search: Just type your topic (e.g., "machine learning")
+- Find preprints: Add "arxiv" (e.g., "transformer models arxiv")
+- Conference papers: Add conference name (e.g., "attention mechanism NeurIPS")
+- Recent papers: Mention the year (e.g., "RAG papers from 2024")
+- Specific field: Add field terms (e.g., "protein folding deep learning")
+
+Searches are run for you automatically when the user asks for papers.
+After receiving results, summarize them clearly and ask if they want to:
+- Search for something else
+- Refine the search
+- Get more details about a specific paper
+
+If the user's question doesn't require a search, just respond normally.
+Be conversational and helpful."""
+
+GREETING_PROMPT = """Greet me and ask what academic topic I'd like to search for. Briefly explain the search format options."""
+
+_SEARCH_PARAMS = {
+    "query": {"type": "string"},
+    "num_results": {"type": "integer"},
+    "year_from": {"type": "integer"},
+    "year_to": {"type": "integer"},
+}
+
+# JSON schema the router's output is constrained to
+SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action": {"type": "string", "enum": ["search", "chat"]},
+        **_SEARCH_PARAMS,
+        "searches": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"question": {"type": "integer"}, **_SEARCH_PARAMS},
+                "required": ["question", "query"],
+            },
+        },
+    },
+    "required": ["action"],
+}
+
+ROUTER_PROMPT = """Decide whether the user's latest message asks for academic papers or research that needs a Google Scholar search. Reply with JSON only.
+
+To search:
+{"action": "search", "query": "search terms", "num_results": 5, "year_from": 2023}
+
+Parameters:
+- query: The search terms (required)
+- num_results: Number of papers to return (optional, default 5)
+- year_from: Only papers from this year onwards (optional)
+- year_to: Only papers until this year (optional)
+
+If the message contains several tagged questions (<Q1>, <Q2>, ...), request every search at once:
+{"action": "search", "searches": [{"question": 1, "query": "search terms"}, {"question": 2, "query": "other terms"}]}
+
+If no search is needed:
+{"action": "chat"}"""
+
+RESULTS_PROMPT = """Here are the search results:
+
+{results}
+
+Please summarize these findings for me."""
+
+BATCH_RESULTS_PROMPT = """Here are the search results for each question:
+
+{results}
+
+Please summarize the findings for each question, wrapping each answer in matching <A1>...</A1>, <A2>...</A2> tags."""
+
+
+def _search_params(search: dict) -> dict:
+    """Normalize a router search request into search_scholar arguments."""
+    return {
+        "query": search.get("query", ""),
+        "year_from": search.get("year_from"),
+        "year_to": search.get("year_to"),
+        "num_results": search.get("num_results", 5),
+    }
+
+
+class Speculator:
+    """
+    Prefetches likely follow-up searches on a background thread pool.
+
+    Futures are keyed by normalized search parameters; a later search with
+    the same key takes over the in-flight (or finished) request instead of
+    issuing a new one.
+    """
+
+    def __init__(self, max_in_flight: int = MAX_PREFETCH):
+        self.max_in_flight = max_in_flight
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._futures: OrderedDict[tuple, Future[ScholarResult]] = OrderedDict()
+
+    @staticmethod
+    def key(params: dict) -> tuple:
+        """Cache key for search_scholar arguments."""
+        query = " ".join(params["query"].lower().split())
+        return (query, params["year_from"], params["year_to"], params["num_results"])
+
+    def prefetch(self, params: dict) -> None:
+        """Start a search in the background unless one is already pending."""
+        key = self.key(params)
+        if key in self._futures:
+            return
+        self._futures[key] = self._executor.submit(search_scholar, **params)
+        while len(self._futures) > self.max_in_flight:
+            _, oldest = self._futures.popitem(last=False)
+            oldest.cancel()
+
+    def pop(self, params: dict) -> Future[ScholarResult] | None:
+        """Take the prefetched search for params, if there is one."""
+        return self._futures.pop(self.key(params), None)
+
+    def close(self) -> None:
+        """Drop pending prefetches and stop the worker threads."""
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ScholarChatSession:
+    """
+    A conversation with an Ollama model, optionally backed by Google Scholar.
+
+    The session keeps the message history and sends every turn through one
+    shared AsyncClient, so turns reuse the same connection and the
+    server-side prompt cache. When driving it with send() or send_batch(),
+    use it as an async context manager (or call close()) so speculative
+    prefetch threads are stopped.
+
+    Args:
+        model: Ollama model for replies and summaries (default: MODEL)
+        router_model: Ollama model that decides when to search (default: ROUTER_MODEL)
+        stream: Stream tokens as they are generated; also enables the short
+            acknowledgement shown while a search runs
+        use_search: Let the model request Google Scholar searches
+        system_prompt: Override the system prompt (defaults to SYSTEM_PROMPT
+            with search enabled, none otherwise)
+        label: Name shown before replies in the REPL (defaults to the model)
+        client: AsyncClient to use (defaults to the shared client in
+            scholar._ollama)
+        speculate: Prefetch likely follow-up searches (defaults to the
+            SCHOLAR_SPECULATIVE environment variable)
+    """
+
+    def __init__(
+        self,
+        model: str = MODEL,
+        router_model: str = ROUTER_MODEL,
+        stream: bool = True,
+        use_search: bool = True,
+        system_prompt: str | None = None,
+        label: str | None = None,
+        client: AsyncClient | None = None,
+        speculate: bool | None = None,
+    ):
+        self.model = model
+        self.router_model = router_model
+        self.stream = stream
+        self.use_search = use_search
+        self.label = label or model
+        self._client = client
+
+        if system_prompt is None and use_search:
+            system_prompt = SYSTEM_PROMPT
+        self.messages: list[dict] = (
+            [{"role": "system", "content": system_prompt}] if system_prompt else []
+        )
+        # Leading messages (the system prompt) that compaction never touches
+        self._prefix = len(self.messages)
+        self._compaction: asyncio.Task | None = None
+        self._router_warned = False
+
+        if speculate is None:
+            speculate = os.environ.get("SCHOLAR_SPECULATIVE", "") == "1"
+        self.speculator = Speculator() if speculate and use_search else None
+
+    async def __aenter__(self) -> ScholarChatSession:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop speculative prefetching. repl() calls this when it ends."""
+        if self.speculator:
+            self.speculator.close()
+
+    @property
+    def client(self) -> AsyncClient:
+        """The Ollama client used for every request in this session."""
+        return self._client or get_async_client()
+
+    async def send(self, user_text: str) -> str:
+        """Send a user message and return the final reply."""
+        async for _ in self.send_stream(user_text):
+            pass
+        return self.messages[-1]["content"]
+
+    async def send_batch(self, questions: list[str]) -> list[str]:
+        """
+        Answer several questions with one model round-trip per step.
+
+        All questions go into a single tagged user message and the router
+        requests every search in one JSON object; the combined summary is
+        split back into one answer per question.
+        """
+        reply = await self.send(build_numbered_prompt(questions))
+        return split_numbered_response(reply, len(questions))
+
+    async def send_stream(self, user_text: str) -> AsyncIterator[str]:
+        """
+        Send a user message and yield reply text as it should be displayed.
+
+        When a search is needed, the acknowledgement, a search marker, and
+        the summary are yielded in turn.
+        """
+        self.messages.append({"role": "user", "content": user_text})
+
+        action = await self._route() if self.use_search else {}
+        if action.get("action") == "search" and (action.get("query") or action.get("searches")):
+            async for piece in self._search_and_summarize(action):
+                yield piece
+        else:
+            async for piece in self._reply():
+                yield piece
+
+    async def repl(self, title: str | None = None, greet: bool | None = None) -> None:
+        """Run an interactive read-eval-print loop on stdin/stdout."""
+        if greet is None:
+            greet = self.use_search
+
+        print("=" * 60)
+        print(f"  {title or f'{self.label} Chat'}")
+        print("  type 'quit' or 'exit' to end the conversation")
+        print("  press Ctrl-C while a reply is streaming to cancel it")
+        print("=" * 60)
+        print()
+
+        if greet:
+            print(f"{self.label}: ", end="", flush=True)
+            greeting = [*self.messages, {"role": "user", "content": GREETING_PROMPT}]
+            parts = []
+            async for piece in self._generate(greeting):
+                parts.append(piece)
+                print(piece, end="", flush=True)
+            print("\n")
+            self.messages.append({"role": "assistant", "content": "".join(parts)})
+
+        prompt = PromptSession() if PromptSession is not None else None
+        while True:
+            try:
+                if prompt is not None:
+                    user_input = (await prompt.prompt_async("You: ")).strip()
+                else:
+                    user_input = input("You: ").strip()
+            except (KeyboardInterrupt, EOFError):
+                print("\n\nGoodbye!")
+                break
+
+            if not user_input:
+                continue
+
+            if user_input.lower() in ("quit", "exit", "bye", "q"):
+                farewell = "Goodbye! Happy researching!" if self.use_search else "Goodbye!"
+                print(f"\n{self.label}: {farewell}")
+                break
+
+            print(f"\n{self.label}: ", end="", flush=True)
+            if not await self._print_cancellable(user_input):
+                print(" [cancelled]", end="")
+            print("\n")
+
+        self.close()
+
+    async def _print_cancellable(self, user_text: str) -> bool:
+        """
+        Print the reply to user_text, letting Ctrl-C cancel it midway.
+
+        Cancelling the task closes the streaming request, which makes Ollama
+        stop decoding and frees the model for the next prompt. Returns False
+        if the reply was cancelled.
+        """
+
+        async def _print() -> None:
+            async for piece in self.send_stream(user_text):
+                print(piece, end="", flush=True)
+
+        task = asyncio.create_task(_print())
+        loop = asyncio.get_running_loop()
+        # Windows event loops do not support signal handlers
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(signal.SIGINT, task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            return False
+        finally:
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(signal.SIGINT)
+        return True
+
+    async def _route(self) -> dict:
+        """
+        Ask the router model whether the latest user message needs a search.
+
+        If the router model is missing or returns unparsable output, the turn
+        falls back to a plain chat reply instead of failing.
+        """
+        history = [m for m in self.messages[self._prefix :] if m["role"] != "system"]
+        try:
+            response = await self.client.chat(
+                model=self.router_model,
+                messages=[
+                    {"role": "system", "content": ROUTER_PROMPT},
+                    *history[-ROUTER_CONTEXT:],
+                ],
+                format=SEARCH_SCHEMA,
+                keep_alive=KEEP_ALIVE,
+                options=OPTIONS,
+            )
+            return loads(response.message.content)
+        except (ResponseError, ValueError) as e:
+            if not self._router_warned:
+                self._router_warned = True
+                print(
+                    f"\n[Search routing unavailable ({self.router_model}: {e}); replying without search]",
+                    file=sys.stderr,
+                )
+            return {"action": "chat"}
+
+    async def _reply(self) -> AsyncIterator[str]:
+        """Stream the chat model's reply to the history and record it."""
+        parts = []
+        try:
+            async for piece in self._generate(self.messages):
+                parts.append(piece)
+                yield piece
+        except asyncio.CancelledError:
+            # Keep what was shown so the next turn has the context the user saw
+            self.messages.append({"role": "assistant", "content": "".join(parts)})
+            raise
+        self._remember("".join(parts))
+
+    async def _search_and_summarize(self, action: dict) -> AsyncIterator[str]:
+        """Run the searches the router asked for and stream the summary."""
+        batch = bool(action.get("searches"))
+        searches = action.get("searches") or [action]
+        params = [_search_params(search) for search in searches]
+
+        # Start the searches in worker threads, then stream a short
+        # acknowledgement while the SerpAPI requests are in flight
+        tasks = [self._start_search(p) for p in params]
+
+        queries = "; ".join(search.get("query", "") for search in searches)
+        if self.stream:
+            ack = [{"role": "user", "content": ACK_PROMPT.format(query=queries)}]
+            async for piece in self._generate(
+                ack, model=self.router_model, max_tokens=ACK_MAX_TOKENS
+            ):
+                yield piece
+            yield "\n"
+        yield f"[Searching Google Scholar for: {queries}...]\n\n{self.label}: "
+
+        results = await asyncio.gather(*tasks)
+
+        if batch:
+            sections = []
+            for i, (search, result) in enumerate(zip(searches, results, strict=True), 1):
+                num = search.get("question", i)
+                sections.append(f"<R{num}>\n{format_results(result)}</R{num}>")
+            prompt = BATCH_RESULTS_PROMPT.format(results="\n\n".join(sections))
+        else:
+            prompt = RESULTS_PROMPT.format(results=format_results(results[0]))
+
+        # Keep the search request in the history so follow-ups have context
+        self.messages.append({"role": "assistant", "content": json.dumps(action)})
+        self.messages.append({"role": "user", "content": prompt})
+
+        # Users usually ask for more of the same next; fetch that while the
+        # summary is being generated
+        if self.speculator:
+            for p in params:
+                if p["num_results"] < 20:
+                    self.speculator.prefetch({**p, "num_results": min(p["num_results"] * 2, 20)})
+
+        async for piece in self._reply():
+            yield piece
+
+    def _start_search(self, params: dict) -> asyncio.Future[ScholarResult]:
+        """Run a search off the event loop, reusing a prefetched one if available."""
+        if self.speculator:
+            prefetched = self.speculator.pop(params)
+            if prefetched is not None:
+                return asyncio.wrap_future(prefetched)
+        return asyncio.ensure_future(asyncio.to_thread(search_scholar, **params))
+
+    async def _generate(
+        self, messages: list[dict], model: str | None = None, max_tokens: int | None = None
+    ) -> AsyncIterator[str]:
+        """Yield a model's reply to messages, token by token when streaming."""
+        model = model or self.model
+        options = OPTIONS if max_tokens is None else {**OPTIONS, "num_predict": max_tokens}
+        if not self.stream:
+            response = await self.client.chat(
+                model=model, messages=messages, keep_alive=KEEP_ALIVE, options=options
+            )
+            yield response.message.content
+            return
+
+        stream = await self.client.chat(
+            model=model,
+            messages=messages,
+            keep_alive=KEEP_ALIVE,
+            options=options,
+            stream=True,
+        )
+        async for chunk in stream:
+            yield chunk.message.content
+
+    def _remember(self, reply: str) -> None:
+        """Record an assistant reply and summarize old turns if needed."""
+        self.messages.append({"role": "assistant", "content": reply})
+        if len(self.messages) > 2 * MAX_TURNS + COMPACT_SLACK + self._prefix and (
+            self._compaction is None or self._compaction.done()
+        ):
+            self._compaction = asyncio.create_task(self._compact_history())
+
+    async def _compact_history(self) -> None:
+        """
+        Replace all but the last MAX_TURNS turns with a single summary message.
+
+        The system prompt is never touched so the server can keep reusing its
+        cached prefix. Only appends happen while this runs, so the summarized
+        slice can be swapped out in place once the summary arrives.
+        """
+        cut = len(self.messages) - 2 * MAX_TURNS
+        old = self.messages[self._prefix : cut]
+        transcript = "\n\n".join(f"{m['role']}: {m['content']}" for m in old)
+        try:
+            response = await self.client.chat(
+                model=self.router_model,
+                messages=[
+                    {"role": "system", "content": SUMMARY_PROMPT},
+                    {"role": "user", "content": transcript},
+                ],
+                keep_alive=KEEP_ALIVE,
+                options=OPTIONS,
+            )
+        except Exception:  # noqa: BLE001 - keep the full history if summarizing fails
+            return
+        self.messages[self._prefix : cut] = [
+            {
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {response.message.content}",
+            }
+        ]
@@ -0,0 +1,92 @@
+"""
+Prompt and response formatting helpers shared by the LLM examples.
+"""
+
+from __future__ import annotations
+
+import re
+
+from .search import ScholarResult
+
+# Parsed once at import; one block per paper instead of one append per field
+_PAPER_TEMPLATE = (
+    "{i}. {title}\n"
+    "   Authors: {authors}\n"
+    "   Venue: {venue} ({year})\n"
+    "   Citations: {citations}{url}{snippet}"
+)
+
+_ANSWER_TAG = re.compile(r"<A(\d+)>(.*?)</A\1>", re.DOTALL)
+_ANSWER_HEADING = re.compile(
+    r"^\W*(?:answer|question)\s*(\d+)\s*[:.)-][*_]*", re.IGNORECASE | re.MULTILINE
+)
+
+
+def format_results(results: ScholarResult) -> str:
+    """Format search results as plain text for a model prompt."""
+    if results.error:
+        return f"Search error: {results.error}"
+
+    blocks = [
+        _PAPER_TEMPLATE.format(
+            i=i,
+            title=p.title,
+            authors=p.authors,
+            venue=p.venue,
+            year=p.year,
+            citations=p.citations,
+            url=f"\n   URL: {p.url}" if p.url else "",
+            snippet=f"\n   Summary: {p.snippet[:200]}..." if p.snippet else "",
+        )
+        for i, p in enumerate(results.papers, 1)
+    ]
+    return f"Found {results.total_results} papers:\n\n" + "\n\n".join(blocks)
+
+
+def build_numbered_prompt(questions: list[str]) -> str:
+    """
+    Pack several independent questions into a single user message.
+
+    Each question is wrapped in <Qn>...</Qn> tags and the model is asked to
+    answer each one inside matching <An>...</An> tags, so one request (and one
+    system-prompt prefill) serves all of them. Use split_numbered_response to
+    recover the individual answers.
+    """
+    tagged = "\n".join(f"<Q{i}>{q}</Q{i}>" for i, q in enumerate(questions, 1))
+    return (
+        f"Answer each of the following {len(questions)} questions independently.\n\n"
+        f"{tagged}\n\n"
+        "Wrap each answer in matching tags: <A1>...</A1>, <A2>...</A2>, and so on."
+    )
+
+
+def split_numbered_response(text: str, n: int) -> list[str]:
+    """
+    Split a response to build_numbered_prompt into n answers.
+
+    Looks for <An>...</An> tags first, then falls back to "Answer n:" style
+    headings. If neither is found, the whole text is returned as the first
+    answer. Missing answers are returned as empty strings.
+    """
+    answers = [""] * n
+
+    matches = _ANSWER_TAG.findall(text)
+    if matches:
+        for num, body in matches:
+            idx = int(num) - 1
+            if 0 <= idx < n:
+                answers[idx] = body.strip()
+        return answers
+
+    headings = list(_ANSWER_HEADING.finditer(text))
+    if headings:
+        for head, nxt in zip(headings, [*headings[1:], None], strict=True):
+            idx = int(head.group(1)) - 1
+            end = nxt.start() if nxt else len(text)
+            if 0 <= idx < n:
+                answers[idx] = text[head.end() : end].strip()
+        return answers
+
+    if n:
+        answers[0] = text.strip()
+    return answers
@@ -6,13 +6,28 @@ These functions can be called directly or used as tools with any LLM.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
 from dotenv import load_dotenv
-from serpapi import GoogleScholarSearch
+
+from . import _cache
+from ._json import loads
+from ._ratelimit import Limiter
+
+# Publication summaries look like "A Author, B Author - Venue, 2023 - publisher"
+_SUMMARY_SEP = " - "
+# Venue and year in one pass; the greedy venue makes the last year win, so
+# "arXiv:2005.14165, 2020" gives 2020 and "Journal, 2019, 12(3)" gives 2019
+_VENUE_YEAR_RE = re.compile(r"(?P<venue>.*)\b(?P<year>(?:19|20)\d{2})\b", re.DOTALL)
+
+# Malformed IDs are rejected before spending a request on them
+_AUTHOR_ID_RE = re.compile(r"[A-Za-z0-9_-]{10,20}")
+_CITATION_ID_RE = re.compile(r"[A-Za-z0-9_-]{5,40}")
 
 # Load .env file from the package directory or current directory
 _package_dir = Path(__file__).parent.parent
@@ -46,7 +61,111 @@ def _get_api_key() -> str:
     return key
 
 
-@dataclass
+# Top-level response fields the parsers read; metadata, pagination and related
+# searches are dropped before caching so cache files stay small and fast to load
+_RESPONSE_KEYS = ("error", "organic_results", "profiles", "author", "cited_by", "articles")
+
+
+def _prune(results: dict) -> dict:
+    """Keep only the response fields the parsers use."""
+    return {key: results[key] for key in _RESPONSE_KEYS if key in results}
+
+
+def _fetch(params: dict) -> dict:
+    """Run a SerpAPI request, serving repeated requests from the on-disk cache."""
+    results = _cache.get(params)
+    if results is None:
+        # Imported here: the SDK pulls in requests, and the async path and cache
+        # hits never need it
+        from serpapi import GoogleScholarSearch
+
+        results = _prune(GoogleScholarSearch(params).get_dict())
+        _cache.put(params, results)
+    return results
+
+
+SERPAPI_URL = "https://serpapi.com/search.json"
+
+# Retries after a 429 response, backing off exponentially unless told otherwise
+MAX_RETRIES = 3
+# Longest wait honoured from a Retry-After header, in seconds
+MAX_RETRY_DELAY = 60.0
+
+# Shared async HTTP client and rate limiter, recreated if used from a different event loop
+_async_client = None
+_async_limiter: Limiter | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_async_client():
+    """Return the shared httpx.AsyncClient for the running event loop."""
+    global _async_client, _async_limiter, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        import httpx
+
+        _async_client = httpx.AsyncClient(
+            http2=True, timeout=30.0, limits=httpx.Limits(max_keepalive_connections=8)
+        )
+        _async_limiter = Limiter()
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared async HTTP client (e.g. on application shutdown)."""
+    global _async_client, _async_limiter, _async_client_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+    _async_client = None
+    _async_limiter = None
+    _async_client_loop = None
+
+
+def _retry_delay(response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request."""
+    try:
+        delay = float(response.headers.get("retry-after", ""))
+    except ValueError:
+        delay = 2.0**attempt
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def _decode(response) -> dict:
+    """
+    Decode a SerpAPI response, naming the HTTP status if it is not usable.
+
+    SerpAPI reports most failures as JSON with an "error" field, which is
+    passed through; anything else from a failed request is raised.
+    """
+    try:
+        results = loads(response.content)
+    except ValueError:
+        raise RuntimeError(
+            f"SerpAPI returned HTTP {response.status_code} with a non-JSON response"
+        ) from None
+    if response.is_error and not (isinstance(results, dict) and "error" in results):
+        raise RuntimeError(f"SerpAPI request failed with HTTP {response.status_code}")
+    return results
+
+
+async def _afetch(params: dict) -> dict:
+    """Async counterpart of _fetch, using the shared httpx client."""
+    results = _cache.get(params)
+    if results is None:
+        client = _get_async_client()
+        for attempt in range(MAX_RETRIES + 1):
+            async with _async_limiter:
+                response = await client.get(SERPAPI_URL, params=params)
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        results = _prune(_decode(response))
+        _cache.put(params, results)
+    return results
+
+
+@dataclass(slots=True)
 class Paper:
     """A single paper result."""
 
@@ -91,7 +210,7 @@ class ScholarResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """A single author result."""
 
@@ -168,21 +287,64 @@ class CitationResult:
         }
 
 
-def _parse_venue_year(summary: str) -> tuple[str, str]:
-    """Parse venue and year from publication summary."""
-    venue = "Unknown"
-    year = "Unknown"
-    if summary:
-        parts = summary.split(" - ")
-        if len(parts) > 1:
-            venue_year = parts[-1]
-            year_match = re.search(r"\b(19|20)\d{2}\b", venue_year)
-            if year_match:
-                year = year_match.group()
-            venue = (
-                venue_year.rsplit(",", 1)[0].strip() if "," in venue_year else venue_year.strip()
+def _parse_summary(summary: str) -> tuple[str, str, str]:
+    """Parse authors, venue and year from a publication summary."""
+    parts = summary.split(_SUMMARY_SEP)
+    if len(parts) == 1:
+        return parts[0], "Unknown", "Unknown"
+    # With three or more parts the last one is the hosting site, not the venue
+    venue_year = parts[1] if len(parts) > 2 else parts[-1]
+    match = _VENUE_YEAR_RE.match(venue_year)
+    if match is None:
+        return parts[0], venue_year.strip() or "Unknown", "Unknown"
+    return parts[0], match["venue"].strip(" ,") or "Unknown", match["year"]
+
+
+def _scholar_params(
+    query: str, year_from: int | None, year_to: int | None, num_results: int, start: int
+) -> dict:
+    """Build SerpAPI parameters for a paper search."""
+    params = {
+        "engine": "google_scholar",
+        "q": query,
+        "api_key": _get_api_key(),
+        "num": num_results,
+    }
+    if year_from:
+        params["as_ylo"] = year_from
+    if year_to:
+        params["as_yhi"] = year_to
+    if start:
+        params["start"] = start
+    return params
+
+
+def _parse_scholar(query: str, results: dict, num_results: int) -> ScholarResult:
+    """Build a ScholarResult from a SerpAPI paper search response."""
+    if "error" in results:
+        return ScholarResult(query=query, total_results=0, error=results["error"])
+
+    papers = []
+    for result in islice(results.get("organic_results", ()), num_results):
+        g = result.get
+        authors, venue, year = _parse_summary((g("publication_info") or {}).get("summary", ""))
+        cited_by = (g("inline_links") or {}).get("cited_by") or {}
+        resources = g("resources")
+
+        papers.append(
+            Paper(
+                title=g("title", "Unknown"),
+                authors=authors,
+                venue=venue,
+                year=year,
+                snippet=g("snippet", ""),
+                citations=cited_by.get("total", 0),
+                url=g("link", ""),
+                pdf_url=resources[0].get("link", "") if resources else "",
             )
-    return venue, year
+        )
+
+    return ScholarResult(query=query, total_results=len(papers), papers=papers)
 
 
 def search_scholar(
@@ -190,6 +352,7 @@ def search_scholar(
     year_from: int | None = None,
     year_to: int | None = None,
     num_results: int = 10,
+    start: int = 0,
 ) -> ScholarResult:
     """
     Search Google Scholar for academic papers.
@@ -207,58 +370,66 @@ def search_scholar(
         year_from: Filter papers from this year (inclusive)
         year_to: Filter papers until this year (inclusive)
         num_results: Maximum results to return (1-20)
+        start: Offset of the first result, for fetching later pages
 
     Returns:
         ScholarResult with list of papers
     """
     try:
-        api_key = _get_api_key()
         num_results = max(1, min(num_results, 20))
+        params = _scholar_params(query, year_from, year_to, num_results, start)
+        return _parse_scholar(query, _fetch(params), num_results)
 
-        params = {
-            "engine": "google_scholar",
-            "q": query,
-            "api_key": api_key,
-            "num": num_results,
-        }
-        if year_from:
-            params["as_ylo"] = year_from
-        if year_to:
-            params["as_yhi"] = year_to
-
-        search = GoogleScholarSearch(params)
-        results = search.get_dict()
-
-        if "error" in results:
-            return ScholarResult(query=query, total_results=0, error=results["error"])
-
-        papers = []
-        for result in results.get("organic_results", [])[:num_results]:
-            pub_info = result.get("publication_info", {})
-            summary = pub_info.get("summary", "")
-            venue, year = _parse_venue_year(summary)
-
-            papers.append(
-                Paper(
-                    title=result.get("title", "Unknown"),
-                    authors=summary.split(" - ")[0] if " - " in summary else summary,
-                    venue=venue,
-                    year=year,
-                    snippet=result.get("snippet", ""),
-                    citations=result.get("inline_links", {}).get("cited_by", {}).get("total", 0),
-                    url=result.get("link", ""),
-                    pdf_url=result.get("resources", [{}])[0].get("link", "")
-                    if result.get("resources")
-                    else "",
-                )
-            )
+    except Exception as e:  # noqa: BLE001 - API boundary handler
+        return ScholarResult(query=query, total_results=0, error=str(e))
 
-        return ScholarResult(query=query, total_results=len(papers), papers=papers)
+
+async def async_search_scholar(
+    query: str,
+    year_from: int | None = None,
+    year_to: int | None = None,
+    num_results: int = 10,
+    start: int = 0,
+) -> ScholarResult:
+    """Async version of search_scholar; independent calls can run concurrently."""
+    try:
+        num_results = max(1, min(num_results, 20))
+        params = _scholar_params(query, year_from, year_to, num_results, start)
+        return _parse_scholar(query, await _afetch(params), num_results)
 
     except Exception as e:  # noqa: BLE001 - API boundary handler
         return ScholarResult(query=query, total_results=0, error=str(e))
 
 
+def _author_search_params(author_name: str) -> dict:
+    """Build SerpAPI parameters for an author search."""
+    return {
+        "engine": "google_scholar_profiles",
+        "mauthors": author_name,
+        "api_key": _get_api_key(),
+    }
+
+
+def _parse_author_search(author_name: str, results: dict) -> AuthorResult:
+    """Build an AuthorResult from a SerpAPI profiles response."""
+    if "error" in results:
+        return AuthorResult(query=author_name, error=results["error"])
+
+    authors = [
+        Author(
+            name=profile.get("name", "Unknown"),
+            author_id=profile.get("author_id", ""),
+            affiliation=profile.get("affiliations", "Unknown"),
+            email_domain=profile.get("email", ""),
+            citations=profile.get("cited_by", 0),
+            interests=[i.get("title", "") for i in profile.get("interests", ())],
+        )
+        for profile in islice(results.get("profiles", ()), 5)
+    ]
+
+    return AuthorResult(query=author_name, authors=authors)
+
+
 def search_author(author_name: str) -> AuthorResult:
     """
     Search for an author on Google Scholar.
@@ -270,39 +441,74 @@ def search_author(author_name: str) -> AuthorResult:
         AuthorResult with matching authors and their IDs
     """
     try:
-        api_key = _get_api_key()
+        params = _author_search_params(author_name)
+        return _parse_author_search(author_name, _fetch(params))
 
-        params = {
-            "engine": "google_scholar_profiles",
-            "mauthors": author_name,
-            "api_key": api_key,
-        }
+    except Exception as e:  # noqa: BLE001 - API boundary handler
+        return AuthorResult(query=author_name, error=str(e))
 
-        search = GoogleScholarSearch(params)
-        results = search.get_dict()
-
-        if "error" in results:
-            return AuthorResult(query=author_name, error=results["error"])
-
-        authors = []
-        for profile in results.get("profiles", [])[:5]:
-            authors.append(
-                Author(
-                    name=profile.get("name", "Unknown"),
-                    author_id=profile.get("author_id", ""),
-                    affiliation=profile.get("affiliations", "Unknown"),
-                    email_domain=profile.get("email", ""),
-                    citations=profile.get("cited_by", 0),
-                    interests=[i.get("title", "") for i in profile.get("interests", [])],
-                )
-            )
 
-        return AuthorResult(query=author_name, authors=authors)
+async def async_search_author(author_name: str) -> AuthorResult:
+    """Async version of search_author."""
+    try:
+        params = _author_search_params(author_name)
+        return _parse_author_search(author_name, await _afetch(params))
 
     except Exception as e:  # noqa: BLE001 - API boundary handler
         return AuthorResult(query=author_name, error=str(e))
 
 
+def _author_profile_params(author_id: str) -> dict:
+    """Build SerpAPI parameters for an author profile lookup."""
+    if not _AUTHOR_ID_RE.fullmatch(author_id):
+        raise ValueError(f"Invalid author ID: {author_id!r}")
+    return {
+        "engine": "google_scholar_author",
+        "author_id": author_id,
+        "api_key": _get_api_key(),
+    }
+
+
+def _parse_author_profile(author_id: str, results: dict) -> AuthorResult:
+    """Build an AuthorResult from a SerpAPI author response."""
+    if "error" in results:
+        return AuthorResult(query=author_id, error=results["error"])
+
+    author_data = results.get("author", {})
+    table = (results.get("cited_by") or {}).get("table")
+    # The first row of the metrics table holds the all-time values
+    metrics = table[0] if table else {}
+
+    author = Author(
+        name=author_data.get("name", "Unknown"),
+        author_id=author_id,
+        affiliation=author_data.get("affiliations", "Unknown"),
+        email_domain=author_data.get("email", ""),
+        citations=(metrics.get("citations") or {}).get("all", 0),
+        interests=[i.get("title", "") for i in author_data.get("interests", [])],
+    )
+
+    publications = [
+        {
+            "title": article.get("title", "Unknown"),
+            "year": article.get("year", "Unknown"),
+            "citations": (article.get("cited_by") or {}).get("value", 0),
+        }
+        for article in islice(results.get("articles", ()), 10)
+    ]
+
+    h_index = (metrics.get("h_index") or {}).get("all", 0)
+    i10_index = (metrics.get("i10_index") or {}).get("all", 0)
+
+    return AuthorResult(
+        query=author_id,
+        authors=[author],
+        h_index=h_index,
+        i10_index=i10_index,
+        publications=publications,
+    )
+
+
 def get_author_profile(author_id: str) -> AuthorResult:
     """
     Get detailed author profile by Google Scholar author ID.
@@ -314,66 +520,62 @@ def get_author_profile(author_id: str) -> AuthorResult:
         AuthorResult with author details, h-index, and publications
     """
     try:
-        api_key = _get_api_key()
+        params = _author_profile_params(author_id)
+        return _parse_author_profile(author_id, _fetch(params))
 
-        params = {
-            "engine": "google_scholar_author",
-            "author_id": author_id,
-            "api_key": api_key,
-        }
+    except Exception as e:  # noqa: BLE001 - API boundary handler
+        return AuthorResult(query=author_id, error=str(e))
 
-        search = GoogleScholarSearch(params)
-        results = search.get_dict()
-
-        if "error" in results:
-            return AuthorResult(query=author_id, error=results["error"])
-
-        author_data = results.get("author", {})
-        cited_by = results.get("cited_by", {})
-        articles = results.get("articles", [])
-
-        author = Author(
-            name=author_data.get("name", "Unknown"),
-            author_id=author_id,
-            affiliation=author_data.get("affiliations", "Unknown"),
-            email_domain=author_data.get("email", ""),
-            citations=cited_by.get("table", [{}])[0].get("citations", {}).get("all", 0)
-            if cited_by.get("table")
-            else 0,
-            interests=[i.get("title", "") for i in author_data.get("interests", [])],
-        )
 
-        publications = []
-        for article in articles[:10]:
-            publications.append(
-                {
-                    "title": article.get("title", "Unknown"),
-                    "year": article.get("year", "Unknown"),
-                    "citations": article.get("cited_by", {}).get("value", 0),
-                }
-            )
+async def async_get_author_profile(author_id: str) -> AuthorResult:
+    """Async version of get_author_profile."""
+    try:
+        params = _author_profile_params(author_id)
+        return _parse_author_profile(author_id, await _afetch(params))
+
+    except Exception as e:  # noqa: BLE001 - API boundary handler
+        return AuthorResult(query=author_id, error=str(e))
 
-        h_index = (
-            cited_by.get("table", [{}])[0].get("h_index", {}).get("all", 0)
-            if cited_by.get("table")
-            else 0
-        )
-        i10_index = (
-            cited_by.get("table", [{}])[0].get("i10_index", {}).get("all", 0)
-            if cited_by.get("table")
-            else 0
-        )
 
-        return AuthorResult(
-            query=author_id,
-            authors=[author],
-            h_index=h_index,
-            i10_index=i10_index,
-            publications=publications,
+def _citations_params(citation_id: str, num_results: int) -> dict:
+    """Build SerpAPI parameters for a citing-papers lookup."""
+    if not _CITATION_ID_RE.fullmatch(citation_id):
+        raise ValueError(f"Invalid citation ID: {citation_id!r}")
+    return {
+        "engine": "google_scholar",
+        "cites": citation_id,
+        "api_key": _get_api_key(),
+        "num": num_results,
+    }
+
+
+def _parse_citations(citation_id: str, results: dict, num_results: int) -> CitationResult:
+    """Build a CitationResult from a SerpAPI cites response."""
+    if "error" in results:
+        return CitationResult(citation_id=citation_id, total_citations=0, error=results["error"])
+
+    papers = []
+    for result in islice(results.get("organic_results", ()), num_results):
+        g = result.get
+        authors, venue, year = _parse_summary((g("publication_info") or {}).get("summary", ""))
+
+        papers.append(
+            Paper(
+                title=g("title", "Unknown"),
+                authors=authors,
+                venue=venue,
+                year=year,
+                snippet=g("snippet", ""),
+                citations=0,
+                url=g("link", ""),
+            )
         )
 
-    except Exception as e:  # noqa: BLE001 - API boundary handler
-        return AuthorResult(query=author_id, error=str(e))
+    return CitationResult(
+        citation_id=citation_id,
+        total_citations=len(papers),
+        citing_papers=papers,
+    )
 
 
 def get_paper_citations(citation_id: str, num_results: int = 10) -> CitationResult:
@@ -388,47 +590,20 @@ def get_paper_citations(citation_id: str, num_results: int = 10) -> CitationResu
         CitationResult with list of citing papers
     """
     try:
-        api_key = _get_api_key()
         num_results = max(1, min(num_results, 20))
+        params = _citations_params(citation_id, num_results)
+        return _parse_citations(citation_id, _fetch(params), num_results)
 
-        params = {
-            "engine": "google_scholar",
-            "cites": citation_id,
-            "api_key": api_key,
-            "num": num_results,
-        }
-
-        search = GoogleScholarSearch(params)
-        results = search.get_dict()
-
-        if "error" in results:
-            return CitationResult(
-                citation_id=citation_id, total_citations=0, error=results["error"]
-            )
+    except Exception as e:  # noqa: BLE001 - API boundary handler
+        return CitationResult(citation_id=citation_id, total_citations=0, error=str(e))
 
-        papers = []
-        for result in results.get("organic_results", [])[:num_results]:
-            pub_info = result.get("publication_info", {})
-            summary = pub_info.get("summary", "")
-            venue, year = _parse_venue_year(summary)
-
-            papers.append(
-                Paper(
-                    title=result.get("title", "Unknown"),
-                    authors=summary.split(" - ")[0] if " - " in summary else summary,
-                    venue=venue,
-                    year=year,
-                    snippet=result.get("snippet", ""),
-                    citations=0,
-                    url=result.get("link", ""),
-                )
-            )
 
-        return CitationResult(
-            citation_id=citation_id,
-            total_citations=len(papers),
-            citing_papers=papers,
-        )
+async def async_get_paper_citations(citation_id: str, num_results: int = 10) -> CitationResult:
+    """Async version of get_paper_citations."""
+    try:
+        num_results = max(1, min(num_results, 20))
+        params = _citations_params(citation_id, num_results)
+        return _parse_citations(citation_id, await _afetch(params), num_results)
 
     except Exception as e:  # noqa: BLE001 - API boundary handler
         return CitationResult(citation_id=citation_id, total_citations=0, error=str(e))
@@ -0,0 +1,59 @@
+"""Tests for the on-disk SerpAPI response cache."""
+
+import os
+
+import pytest
+
+from scholar import _cache
+
+PARAMS = {"engine": "google_scholar", "q": "rag", "api_key": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("SERP_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("SCHOLAR_CACHE_DISABLE", raising=False)
+    _cache._memory.clear()
+
+
+def test_round_trip_ignores_api_key():
+    _cache.put(PARAMS, {"organic_results": [{"title": "A"}]})
+    assert _cache.get({**PARAMS, "api_key": "other"}) == {"organic_results": [{"title": "A"}]}
+
+
+def test_errors_are_not_stored(tmp_path):
+    _cache.put(PARAMS, {"error": "Invalid API key"})
+    assert _cache.get(PARAMS) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_disable(monkeypatch, tmp_path):
+    monkeypatch.setenv("SCHOLAR_CACHE_DISABLE", "1")
+    _cache.put(PARAMS, {"organic_results": []})
+    assert _cache.get(PARAMS) is None
+    assert not list(tmp_path.iterdir())
+
+
+def _age(tmp_path, seconds):
+    """Backdate every cache file by the given number of seconds."""
+    for path in tmp_path.iterdir():
+        stat = path.stat()
+        os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_ttl_depends_on_engine(tmp_path):
+    author = {"engine": "google_scholar_author", "author_id": "JicYPdAAAAAJ"}
+    _cache.put(PARAMS, {"organic_results": []})
+    _cache.put(author, {"author": {"name": "A"}})
+    _cache._memory.clear()
+    _age(tmp_path, 2 * 24 * 60 * 60)
+
+    assert _cache.get(PARAMS) is None
+    assert _cache.get(author) == {"author": {"name": "A"}}
+
+
+def test_cache_dir_is_read_per_call(monkeypatch, tmp_path):
+    other = tmp_path / "other"
+    monkeypatch.setenv("SERP_CACHE_DIR", str(other))
+    _cache.put(PARAMS, {"organic_results": []})
+    assert len(list(other.iterdir())) == 1
@@ -0,0 +1,77 @@
+"""Tests for the async SerpAPI fetch path: retries, error handling and rate limiting."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from scholar import search
+from scholar._ratelimit import Limiter
+
+
+@pytest.fixture(autouse=True)
+def _no_cache(monkeypatch):
+    monkeypatch.setenv("SCHOLAR_CACHE_DISABLE", "1")
+
+
+def _afetch_with(handler):
+    """Run _afetch against a mock transport and return its result."""
+
+    async def run():
+        search._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        search._async_limiter = Limiter(per_minute=6000, concurrency=5)
+        search._async_client_loop = asyncio.get_running_loop()
+        try:
+            return await search._afetch({"engine": "google_scholar", "q": "rag"})
+        finally:
+            await search.close_async_client()
+
+    return asyncio.run(run())
+
+
+def test_retries_after_429():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"organic_results": []})
+
+    assert _afetch_with(handler) == {"organic_results": []}
+    assert len(calls) == 2
+
+
+def test_retry_after_is_clamped():
+    response = httpx.Response(429, headers={"Retry-After": "3600"})
+    assert search._retry_delay(response, 0) == search.MAX_RETRY_DELAY == 60.0
+    assert search._retry_delay(httpx.Response(429), 2) == 4.0
+
+
+def test_non_json_error_names_status():
+    with pytest.raises(RuntimeError, match="HTTP 500"):
+        _afetch_with(lambda request: httpx.Response(500, text="<html>oops</html>"))
+
+
+def test_json_error_is_passed_through():
+    result = _afetch_with(lambda request: httpx.Response(401, json={"error": "Invalid API key"}))
+    assert result == {"error": "Invalid API key"}
+
+
+def test_limiter_caps_requests_in_flight():
+    in_flight = peak = 0
+
+    async def request(limiter):
+        nonlocal in_flight, peak
+        async with limiter:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def run():
+        limiter = Limiter(per_minute=60000, concurrency=3)
+        await asyncio.gather(*(request(limiter) for _ in range(10)))
+
+    asyncio.run(run())
+    assert peak == 3
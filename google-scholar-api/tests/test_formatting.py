@@ -0,0 +1,29 @@
+"""Tests for packing several questions into one prompt and splitting the answers."""
+
+from scholar.formatting import build_numbered_prompt, split_numbered_response
+
+
+def test_build_numbered_prompt_tags_each_question():
+    prompt = build_numbered_prompt(["first?", "second?"])
+    assert "<Q1>first?</Q1>" in prompt
+    assert "<Q2>second?</Q2>" in prompt
+    assert "<A1>" in prompt
+
+
+def test_split_tagged_answers():
+    text = "<A2> two </A2>\nnoise\n<A1>one</A1><A3>ignored</A3>"
+    assert split_numbered_response(text, 2) == ["one", "two"]
+
+
+def test_split_heading_fallback():
+    text = "**Answer 1:** foo\n\nAnswer 2) bar\nmore bar"
+    assert split_numbered_response(text, 2) == ["foo", "bar\nmore bar"]
+
+
+def test_split_missing_answers_are_empty():
+    assert split_numbered_response("<A2>only two</A2>", 3) == ["", "only two", ""]
+
+
+def test_split_untagged_text_goes_to_first_answer():
+    assert split_numbered_response("  just prose  ", 2) == ["just prose", ""]
+    assert split_numbered_response("anything", 0) == []
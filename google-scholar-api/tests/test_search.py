@@ -0,0 +1,30 @@
+"""Tests for parsing SerpAPI publication summaries."""
+
+import pytest
+
+from scholar.search import _parse_summary
+
+
+@pytest.mark.parametrize(
+    ("summary", "expected"),
+    [
+        (
+            "A Vaswani, N Shazeer - Advances in neural information processing systems, 2017"
+            " - proceedings.neurips.cc",
+            ("A Vaswani, N Shazeer", "Advances in neural information processing systems", "2017"),
+        ),
+        (
+            "T Brown, B Mann - arXiv preprint arXiv:2005.14165, 2020 - arxiv.org",
+            ("T Brown, B Mann", "arXiv preprint arXiv:2005.14165", "2020"),
+        ),
+        ("A - 2023", ("A", "Unknown", "2023")),
+        ("A - Nature 2023", ("A", "Nature", "2023")),
+        ("A - Journal of X, 2019, 12(3)", ("A", "Journal of X", "2019")),
+        ("A - Nature, 2021 - nature.com", ("A", "Nature", "2021")),
+        ("A - arxiv.org", ("A", "arxiv.org", "Unknown")),
+        ("A Author, B Author", ("A Author, B Author", "Unknown", "Unknown")),
+        ("", ("", "Unknown", "Unknown")),
+    ],
+)
+def test_parse_summary(summary, expected):
+    assert _parse_summary(summary) == expected
@@ -5,19 +5,29 @@ Provides tools for searching academic papers, getting citations,
 and retrieving author profiles from Google Scholar via SerpAPI.
 
 This server wraps the google-scholar-api library (../google-scholar-api/)
-as an MCP tool server for use with Claude Code and Claude Desktop.
+as an MCP tool server for use with Claude Code and Claude Desktop. The tools
+use the library's async functions, so concurrent tool calls share one HTTP/2
+connection to SerpAPI instead of queueing behind each other.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Import from the google-scholar-api library (sibling directory)
 # Install it with: pip install -e ../google-scholar-api
 _api_dir = Path(__file__).parent.parent / "google-scholar-api"
@@ -25,18 +35,19 @@ if _api_dir.exists() and str(_api_dir) not in sys.path:
     sys.path.insert(0, str(_api_dir))
 
 from scholar import (
-    get_author_profile as _get_author_profile,
+    async_get_author_profile as _get_author_profile,
 )
 from scholar import (
-    get_paper_citations as _get_paper_citations,
+    async_get_paper_citations as _get_paper_citations,
 )
 from scholar import (
-    search_author as _search_author,
+    async_search_author as _search_author,
 )
 from scholar import (
-    search_scholar as _search_scholar,
+    async_search_scholar as _search_scholar,
 )
 from scholar import (
+    close_async_client,
     set_api_key,
 )
 
@@ -48,6 +59,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("google-scholar-mcp")
 
+# httpx logs each request URL at INFO, and SerpAPI URLs carry the api_key
+for _name in ("httpx", "httpcore"):
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
 # Initialize the MCP server with instructions
 SERVER_INSTRUCTIONS = """
 Google Scholar MCP Server - Academic Literature Search
@@ -71,7 +86,20 @@ When presenting results, always note the publication venue/source so users
 can identify preprints vs peer-reviewed articles.
 """
 
-mcp = FastMCP("google-scholar", instructions=SERVER_INSTRUCTIONS)
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared SerpAPI HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_async_client()
+
+
+mcp = FastMCP("google-scholar", instructions=SERVER_INSTRUCTIONS, lifespan=_lifespan)
+
+# Most profiles fetched by one get_author_profiles_batch call
+MAX_BATCH = 20
 
 # Get API key from environment and configure the library
 SERPAPI_KEY = os.environ.get("SERPAPI_KEY", "")
@@ -79,8 +107,32 @@ if SERPAPI_KEY:
     set_api_key(SERPAPI_KEY)
 
 
+def _dump(obj) -> str:
+    """Serialize a tool result as compact JSON; MCP clients do not need indentation."""
+    # FastMCP wraps a returned str in TextContent as is; bytes would not be passed
+    # through as text, so the one decode of orjson's UTF-8 output stays.
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+_BATCH_TOO_LARGE = _dump({"error": f"At most {MAX_BATCH} author IDs per batch"})
+
+
+def _respond(result) -> str:
+    """
+    Return a library result as JSON, logging it if the request failed.
+
+    Failed requests keep the same shape as successful ones, with empty
+    result lists and the message in "error" (null on success).
+    """
+    if result.error:
+        logger.warning("Request failed: %s", result.error)
+    return _dump(result.to_dict())
+
+
 @mcp.tool()
-def search_scholar(
+async def search_scholar(
     query: str,
     year_from: int | None = None,
     year_to: int | None = None,
@@ -113,21 +165,22 @@ def search_scholar(
         num_results: Maximum number of results to return (1-20, default 10)
 
     Returns:
-        JSON string with search results including titles, authors, venue/source, and citations
+        JSON string with search results including titles, authors, venue/source, and citations.
+        On failure the lists are empty and "error" holds the message (null on success).
     """
-    logger.info(f"Searching Google Scholar for: {query}")
-    result = _search_scholar(
+    logger.info("Searching Google Scholar for: %s", query)
+    result = await _search_scholar(
         query=query,
         year_from=year_from,
         year_to=year_to,
         num_results=num_results,
     )
-    logger.info(f"Found {result.total_results} results for query: {query}")
-    return json.dumps(result.to_dict(), indent=2)
+    logger.info("Found %d results for query: %s", result.total_results, query)
+    return _respond(result)
 
 
 @mcp.tool()
-def get_paper_citations(
+async def get_paper_citations(
     citation_id: str,
     num_results: int = 10,
 ) -> str:
@@ -139,16 +192,17 @@ def get_paper_citations(
         num_results: Maximum number of citing papers to return (1-20, default 10)
 
     Returns:
-        JSON string with list of papers that cite the given paper
+        JSON string with list of papers that cite the given paper.
+        On failure the list is empty and "error" holds the message (null on success).
     """
-    logger.info(f"Getting citations for ID: {citation_id}")
-    result = _get_paper_citations(citation_id=citation_id, num_results=num_results)
-    logger.info(f"Found {result.total_citations} citing papers")
-    return json.dumps(result.to_dict(), indent=2)
+    logger.info("Getting citations for ID: %s", citation_id)
+    result = await _get_paper_citations(citation_id=citation_id, num_results=num_results)
+    logger.info("Found %d citing papers", result.total_citations)
+    return _respond(result)
 
 
 @mcp.tool()
-def get_author_profile(author_id: str) -> str:
+async def get_author_profile(author_id: str) -> str:
     """
     Get an author's profile from Google Scholar using their author ID.
 
@@ -159,17 +213,43 @@ def get_author_profile(author_id: str) -> str:
         author_id: Google Scholar author ID (e.g., "JicYPdAAAAAJ")
 
     Returns:
-        JSON string with author profile including name, affiliation, citations, and publications
+        JSON string with author profile including name, affiliation, citations, and publications.
+        On failure "authors" is empty and "error" holds the message (null on success).
     """
-    logger.info(f"Getting author profile for ID: {author_id}")
-    result = _get_author_profile(author_id=author_id)
+    logger.info("Getting author profile for ID: %s", author_id)
+    result = await _get_author_profile(author_id=author_id)
     if result.authors:
-        logger.info(f"Found author: {result.authors[0].name}")
-    return json.dumps(result.to_dict(), indent=2)
+        logger.info("Found author: %s", result.authors[0].name)
+    return _respond(result)
+
+
+@mcp.tool()
+async def get_author_profiles_batch(author_ids: list[str]) -> str:
+    """
+    Get several author profiles at once, fetched concurrently.
+
+    Use this instead of repeated get_author_profile calls when comparing
+    authors or reviewing a group's work.
+
+    Args:
+        author_ids: Google Scholar author IDs (at most 20)
+
+    Returns:
+        JSON string with a list of author profiles, in the order requested, each
+        shaped like a get_author_profile result (failed lookups carry "error").
+        If more than 20 IDs are given, a single {"error": ...} object is returned.
+    """
+    if len(author_ids) > MAX_BATCH:
+        return _BATCH_TOO_LARGE
+    logger.info("Getting %d author profiles", len(author_ids))
+    results = await asyncio.gather(
+        *(_get_author_profile(author_id=author_id) for author_id in author_ids)
+    )
+    return _dump([result.to_dict() for result in results])
 
 
 @mcp.tool()
-def search_author(
+async def search_author(
     author_name: str,
 ) -> str:
     """
@@ -179,12 +259,13 @@ def search_author(
         author_name: Name of the author to search for (e.g., "Geoffrey Hinton")
 
     Returns:
-        JSON string with matching authors and their IDs
+        JSON string with matching authors and their IDs.
+        On failure "authors" is empty and "error" holds the message (null on success).
     """
-    logger.info(f"Searching for author: {author_name}")
-    result = _search_author(author_name=author_name)
-    logger.info(f"Found {len(result.authors)} matching authors")
-    return json.dumps(result.to_dict(), indent=2)
+    logger.info("Searching for author: %s", author_name)
+    result = await _search_author(author_name=author_name)
+    logger.info("Found %d matching authors", len(result.authors))
+    return _respond(result)
 
 
 def main():